@@ -40,6 +40,8 @@ setuptools.setup(
     # install_requires=['Pillow'],
     extras_require={
         'dev': ['check-manifest'],
+        'async': ['aiobotocore'],
+        'orjson': ['orjson'],
         # 'test': ['coverage'],
     },
     # entry_points={
@@ -2,3 +2,4 @@ __version__ = "0.9.6"
 
 from .client import *
 from .builder import *
+from .deleter import *
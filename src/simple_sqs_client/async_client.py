@@ -0,0 +1,209 @@
+import asyncio
+import logging
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+
+from .client import BATCH_SIZE, MAX_POOL_CONNECTIONS, MAX_RETRY_ATTEMPTS, MAX_WAIT_TIME_SECONDS, \
+    _attribute_kwargs, _chunk_bodies, _delete_entries, _send_entries, _split_failed, _validate_wait_time_seconds
+
+
+class AsyncSQSClient:
+    """
+    An asyncio client for interacting with an SQS (Simple Queue Service) in AWS, built on aiobotocore.
+    """
+
+    def __init__(self, region_name: str, aws_access_key_id: str, aws_secret_access_key: str,
+                 queue_url: str, max_pool_connections: int = MAX_POOL_CONNECTIONS,
+                 max_retry_attempts: int = MAX_RETRY_ATTEMPTS) -> 'AsyncSQSClient':
+        """
+        Initializes the async SQS client with the specified AWS credentials and region.
+        The underlying client is created by initialize or when entering the async context,
+        and at most max_pool_connections requests are in flight at once.
+
+        Args:
+            region_name (str): The AWS region name.
+            aws_access_key_id (str): The AWS access key ID.
+            aws_secret_access_key (str): The AWS secret access key.
+            queue_url (str): The AWS SQS queue name
+            max_pool_connections (int): The maximum number of HTTP connections kept in the pool
+            max_retry_attempts (int): The maximum number of retries per request, made with exponential backoff
+        """
+        self.region_name = region_name
+        self.aws_access_key_id = aws_access_key_id
+        self.aws_secret_access_key = aws_secret_access_key
+        self.queue_url = queue_url
+        self.max_pool_connections = max_pool_connections
+        self.max_retry_attempts = max_retry_attempts
+
+        self.logger = logging.getLogger(__name__)
+
+        self.session = AioSession()
+        self.sqs = None
+        self._client_context = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def initialize(self) -> None:
+        """
+        Creates the long-lived SQS client shared by all requests.
+
+        Returns:
+            None
+        """
+        if self.sqs is not None:
+            return
+
+        self._client_context = self.session.create_client(
+            'sqs', region_name=self.region_name,
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            config=AioConfig(max_pool_connections=self.max_pool_connections,
+                             tcp_keepalive=True,
+                             retries={'mode': 'standard', 'max_attempts': self.max_retry_attempts},
+                             connect_timeout=3,
+                             read_timeout=30))
+        self.sqs = await self._client_context.__aenter__()
+        self._semaphore = asyncio.Semaphore(self.max_pool_connections)
+
+    async def close(self) -> None:
+        """
+        Closes the SQS client and its connection pool.
+
+        Returns:
+            None
+        """
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+        self._client_context = None
+        self.sqs = None
+        self._semaphore = None
+
+    def _check_initialized(self) -> None:
+        if self.sqs is None:
+            raise RuntimeError("AsyncSQSClient is not initialized, "
+                               "call initialize or use it as an async context manager")
+
+    async def send_messages(self, bodies: list) -> dict:
+        """
+        Sends messages to the SQS queue in concurrent batches of up to 10 messages and 256 KiB of bodies per request.
+        Entries failed by SQS through no fault of the sender are retried once.
+
+        Args:
+            bodies (list): The bodies of the messages as dictionaries dumped to JSON strings.
+        Returns:
+            dict: aggregated 'Successful' and 'Failed' entries from AWS SQS, with each entry 'Id'
+                being the index of its body in bodies
+        Raises:
+            RuntimeError: If the client is not initialized.
+            Exception: If an error occurs while sending the messages.
+        """
+        self._check_initialized()
+
+        responses = await asyncio.gather(*(
+            self._send_batch(start, chunk) for start, chunk in _chunk_bodies(bodies)
+        ))
+
+        result = {'Successful': [], 'Failed': []}
+        for successful, failed in responses:
+            result['Successful'].extend(successful)
+            result['Failed'].extend(failed)
+        return result
+
+    async def _send_batch(self, start: int, chunk: list) -> tuple:
+        entries = _send_entries(start, chunk)
+        try:
+            async with self._semaphore:
+                response = await self.sqs.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+                successful = response.get('Successful', [])
+                failed, retry_entries = _split_failed(entries, response.get('Failed', []))
+                if retry_entries:
+                    self.logger.debug("Retrying %s failed messages", len(retry_entries))
+                    retry_response = await self.sqs.send_message_batch(QueueUrl=self.queue_url, Entries=retry_entries)
+                    successful = successful + retry_response.get('Successful', [])
+                    failed = failed + retry_response.get('Failed', [])
+        except Exception as e:
+            self.logger.error("Failed to send messages: %s", str(e))
+            raise
+
+        for entry in failed:
+            self.logger.error("Failed to send message: %s", entry.get('Message', entry['Code']))
+        return successful, failed
+
+    async def receive(self, total: int, visibility_timeout: int = 60, wait_time_seconds: int = MAX_WAIT_TIME_SECONDS,
+                      message_attribute_names: list = None, attribute_names: list = None) -> list:
+        """
+        Reads events from the SQS queue using concurrent receive requests of up to 10 messages each.
+
+        Args:
+            total (int): The maximum number of messages to retrieve.
+            visibility_timeout (int): The amount of seconds,a messages stays inside the queue before getting removed
+            wait_time_seconds (int): The amount of seconds client will be polling messages from the queue
+            message_attribute_names (list): The message attributes to retrieve, e.g. ['All'], or None to skip them.
+            attribute_names (list): The system attributes to retrieve, e.g. ['All'], or None to skip them.
+
+        Returns:
+            list: A list of messages retrieved from the queue.
+
+        Raises:
+            ValueError: If wait_time_seconds is out of the range accepted by SQS.
+            RuntimeError: If the client is not initialized.
+        """
+        _validate_wait_time_seconds(wait_time_seconds)
+        self._check_initialized()
+
+        kwargs = _attribute_kwargs(message_attribute_names, attribute_names)
+
+        async def receive_batch(max_batch: int) -> dict:
+            async with self._semaphore:
+                return await self.sqs.receive_message(
+                    QueueUrl=self.queue_url,
+                    MaxNumberOfMessages=max_batch,
+                    VisibilityTimeout=visibility_timeout,
+                    WaitTimeSeconds=wait_time_seconds,
+                    **kwargs
+                )
+
+        responses = await asyncio.gather(*(
+            receive_batch(min(BATCH_SIZE, total - start)) for start in range(0, total, BATCH_SIZE)
+        ))
+        return [message for response in responses for message in response.get('Messages', [])]
+
+    async def delete_events_from_queue(self, events: list) -> dict:
+        """
+        Deletes events from the SQS queue in concurrent batches of up to 10 events per request.
+
+        Args:
+            events (list): The event dictionaries.
+
+        Returns:
+            dict: aggregated 'Successful' and 'Failed' entries from AWS SQS, with each entry 'Id'
+                being the index of its event in events
+
+        Raises:
+            RuntimeError: If the client is not initialized.
+        """
+        self._check_initialized()
+
+        async def delete_batch(start: int) -> dict:
+            async with self._semaphore:
+                return await self.sqs.delete_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=_delete_entries(start, events[start:start + BATCH_SIZE])
+                )
+
+        responses = await asyncio.gather(*(delete_batch(start) for start in range(0, len(events), BATCH_SIZE)))
+
+        result = {'Successful': [], 'Failed': []}
+        for response in responses:
+            for entry in response.get('Failed', []):
+                self.logger.error("Failed to delete message: %s", entry.get('Message', entry['Code']))
+            result['Successful'].extend(response.get('Successful', []))
+            result['Failed'].extend(response.get('Failed', []))
+        return result
@@ -1,4 +1,4 @@
-from .client import SQSClient
+from .client import SQSClient, MAX_POOL_CONNECTIONS, MAX_RETRY_ATTEMPTS
 
 
 class SQSClientBuilder:
@@ -11,6 +11,8 @@ class SQSClientBuilder:
         self.aws_access_key_id = None
         self.aws_secret_access_key = None
         self.queue_url = None
+        self.max_pool_connections = MAX_POOL_CONNECTIONS
+        self.max_retry_attempts = MAX_RETRY_ATTEMPTS
 
     def with_region(self, region_name: str) -> 'SQSClientBuilder':
         """
@@ -53,6 +55,32 @@ class SQSClientBuilder:
         self.queue_url = queue_url
         return self
 
+    def with_max_pool_connections(self, max_pool_connections: int) -> 'SQSClientBuilder':
+        """
+        Sets the maximum number of HTTP connections kept in the pool.
+
+        Args:
+            max_pool_connections (int): The connection pool size.
+
+        Returns:
+            SQSClientBuilder: The updated builder instance.
+        """
+        self.max_pool_connections = max_pool_connections
+        return self
+
+    def with_max_retry_attempts(self, max_retry_attempts: int) -> 'SQSClientBuilder':
+        """
+        Sets the maximum number of retries per request.
+
+        Args:
+            max_retry_attempts (int): The maximum number of retries, excluding the initial attempt.
+
+        Returns:
+            SQSClientBuilder: The updated builder instance.
+        """
+        self.max_retry_attempts = max_retry_attempts
+        return self
+
     def build(self) -> 'SQSClient':
         """
         Builds an instance of SQSClient with the provided configuration.
@@ -74,6 +102,8 @@ class SQSClientBuilder:
         if missing_fields:
             raise ValueError(f"Missing required SQS connection parameters: {', '.join(missing_fields)}")
 
-        client = SQSClient(self.region_name, self.aws_access_key_id, self.aws_secret_access_key, self.queue_url)
+        client = SQSClient(self.region_name, self.aws_access_key_id, self.aws_secret_access_key, self.queue_url,
+                           max_pool_connections=self.max_pool_connections,
+                           max_retry_attempts=self.max_retry_attempts)
         return client
 
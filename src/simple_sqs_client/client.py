@@ -1,6 +1,84 @@
 import boto3
-from botocore.exceptions import WaiterError, HTTPClientError
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
+import queue
+import threading
+import warnings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BATCH_SIZE = 10
+MAX_BATCH_BYTES = 262144
+MAX_POOL_CONNECTIONS = 50
+MAX_RETRY_ATTEMPTS = 5
+MAX_WAIT_TIME_SECONDS = 20
+
+_PREFETCH_STOPPED = object()
+
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _chunk_bodies(bodies: list):
+    """
+    Yields (start, chunk) pairs of up to 10 consecutive bodies whose total size fits in one batch request.
+    """
+    start, size = 0, 0
+    for i, body in enumerate(bodies):
+        body_size = len(body.encode('utf-8'))
+        if i > start and (i - start == BATCH_SIZE or size + body_size > MAX_BATCH_BYTES):
+            yield start, bodies[start:i]
+            start, size = i, 0
+        size += body_size
+    if start < len(bodies):
+        yield start, bodies[start:]
+
+
+def _send_entries(start: int, chunk: list) -> list:
+    return [{'Id': str(start + i), 'MessageBody': body} for i, body in enumerate(chunk)]
+
+
+def _delete_entries(start: int, chunk: list) -> list:
+    return [{'Id': str(start + i), 'ReceiptHandle': event['ReceiptHandle']} for i, event in enumerate(chunk)]
+
+
+def _split_failed(entries: list, failed: list) -> tuple:
+    """
+    Splits failed batch entries into those failed by the sender and the request entries worth retrying.
+    """
+    retry_ids = {entry['Id'] for entry in failed if not entry['SenderFault']}
+    return [entry for entry in failed if entry['SenderFault']], [entry for entry in entries if entry['Id'] in retry_ids]
+
+
+def _attribute_kwargs(message_attribute_names: list, attribute_names: list) -> dict:
+    kwargs = {}
+    if message_attribute_names is not None:
+        kwargs['MessageAttributeNames'] = message_attribute_names
+    if attribute_names is not None:
+        kwargs['AttributeNames'] = attribute_names
+    return kwargs
+
+
+def _validate_max_batch(max_batch: int) -> None:
+    if not 1 <= max_batch <= BATCH_SIZE:
+        raise ValueError(f"max_batch must be between 1 and {BATCH_SIZE}, got {max_batch}")
+
+
+def _validate_wait_time_seconds(wait_time_seconds: int) -> None:
+    if not 0 <= wait_time_seconds <= MAX_WAIT_TIME_SECONDS:
+        raise ValueError(f"wait_time_seconds must be between 0 and {MAX_WAIT_TIME_SECONDS}, got {wait_time_seconds}")
 
 
 class SQSClient:
@@ -8,7 +86,7 @@ class SQSClient:
     A client for interacting with an SQS (Simple Queue Service) in AWS.
     """
 
-    _instances = []
+    _instances = {}
 
     def __new__(cls, *args, **kwargs) -> 'SQSClient':
         """
@@ -22,16 +100,18 @@ class SQSClient:
                    SQSClient: Newly created instance of the SQSClient class or an existing instance with the same parameters.
 
                """
-        existing_instance = cls._get_existing_instance(*args, **kwargs)
+        key = cls._get_instance_key(*args, **kwargs)
+        existing_instance = cls._instances.get(key)
         if existing_instance:
             return existing_instance
         else:
             new_instance = super().__new__(cls)
-            cls._instances.append(new_instance)
+            cls._instances[key] = new_instance
             return new_instance
 
     def __init__(self, region_name: str, aws_access_key_id: str, aws_secret_access_key: str,
-                 queue_url: str) -> 'SQSClient':
+                 queue_url: str, max_pool_connections: int = MAX_POOL_CONNECTIONS,
+                 max_retry_attempts: int = MAX_RETRY_ATTEMPTS) -> 'SQSClient':
         """
         Initializes the SQS client with the specified AWS credentials and region.
 
@@ -40,58 +120,87 @@ class SQSClient:
             aws_access_key_id (str): The AWS access key ID.
             aws_secret_access_key (str): The AWS secret access key.
             queue_url (str): The AWS SQS queue name
+            max_pool_connections (int): The maximum number of HTTP connections kept in the pool
+            max_retry_attempts (int): The maximum number of retries per request, made with exponential backoff
         """
+        if getattr(self, '_initialized', False):
+            return
+
         self.region_name = region_name
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.queue_url = queue_url
+        self.max_pool_connections = max_pool_connections
+        self.max_retry_attempts = max_retry_attempts
 
         self.logger = logging.getLogger(__name__)
 
+        self._prefetch_queue = None
+        self._prefetch_threads = []
+        self._prefetch_stop = threading.Event()
+        self._prefetch_refill = threading.Event()
+
         self._init_client()
+        self._initialized = True
 
     @classmethod
-    def _get_existing_instance(
+    def _get_instance_key(
             cls, region_name: str,
             aws_access_key_id: str,
             aws_secret_access_key: str,
-            queue_url: str) -> 'SQSClient':
+            queue_url: str,
+            max_pool_connections: int = MAX_POOL_CONNECTIONS,
+            max_retry_attempts: int = MAX_RETRY_ATTEMPTS) -> tuple:
         """
-            Checks if an instance of the SQSClient class already exists with the same parameters.
+            Builds the key identifying an instance of the SQSClient class by its connection parameters.
 
             Args:
                 region_name (str): AWS region name.
                 aws_access_key_id (str): AWS access key ID.
                 aws_secret_access_key (str): AWS secret access key.
                 queue_url (str): SQS queue URL.
+                max_pool_connections (int): The maximum number of HTTP connections kept in the pool.
+                max_retry_attempts (int): The maximum number of retries per request.
 
             Returns:
-                SQSClient or None: Existing instance of SQSClient with the same parameters, or None if it doesn't exist.
+                tuple: Key of the instance in the instances cache.
 
             """
-        for instance in cls._instances:
-            if instance.region_name == region_name \
-                    and instance.aws_access_key_id == aws_access_key_id \
-                    and instance.aws_secret_access_key == aws_secret_access_key \
-                    and instance.queue_url == queue_url:
-                return instance
-        return None
+        return (region_name, aws_access_key_id, aws_secret_access_key, queue_url,
+                max_pool_connections, max_retry_attempts)
 
     def __enter__(self):
         self._init_client()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop_prefetcher()
         if self.sqs is not None:
             self.sqs.close()
 
     def _init_client(self):
         """
         Initializes the SQS client using the specified AWS credentials and region.
+        The client is shared with other instances using the same credentials, region and settings,
+        as the queue URL is passed with each request and one connection pool can serve many queues.
         """
-        self.sqs = boto3.client('sqs', region_name=self.region_name,
-                                aws_access_key_id=self.aws_access_key_id,
-                                aws_secret_access_key=self.aws_secret_access_key)
+        key = (self.region_name, self.aws_access_key_id, self.aws_secret_access_key,
+               self.max_pool_connections, self.max_retry_attempts)
+
+        with _CLIENT_CACHE_LOCK:
+            sqs = _CLIENT_CACHE.get(key)
+            if sqs is None:
+                sqs = boto3.client('sqs', region_name=self.region_name,
+                                   aws_access_key_id=self.aws_access_key_id,
+                                   aws_secret_access_key=self.aws_secret_access_key,
+                                   config=Config(max_pool_connections=self.max_pool_connections,
+                                                 tcp_keepalive=True,
+                                                 retries={'mode': 'standard', 'max_attempts': self.max_retry_attempts},
+                                                 connect_timeout=3,
+                                                 read_timeout=30))
+                _CLIENT_CACHE[key] = sqs
+
+        self.sqs = sqs
 
     def send_message(self, body: str) -> dict:
         """
@@ -100,64 +209,263 @@ class SQSClient:
         Args:
             body (str): The body of the message as a dictionary dumped to JSON string.
         Returns:
-            dict: response from AWS SQS
+            dict: response from AWS SQS, with 'MessageId' and 'MD5OfMessageBody'
         Raises:
+            ClientError: If SQS rejects the message.
             Exception: If an error occurs while sending the message.
         """
+        response = self.send_messages([body])
+        for entry in response['Failed']:
+            self._raise_for_failed_entry(entry, 'SendMessage')
+        return response['Successful'][0]
+
+    def send_messages(self, bodies: list) -> dict:
+        """
+        Sends messages to the SQS queue in batches of up to 10 messages and 256 KiB of bodies per request.
+        Entries failed by SQS through no fault of the sender are retried once.
+
+        Args:
+            bodies (list): The bodies of the messages as dictionaries dumped to JSON strings.
+        Returns:
+            dict: aggregated 'Successful' and 'Failed' entries from AWS SQS, with each entry 'Id'
+                being the index of its body in bodies
+        Raises:
+            Exception: If an error occurs while sending the messages.
+        """
+        result = {'Successful': [], 'Failed': []}
+
+        for start, chunk in _chunk_bodies(bodies):
+            entries = _send_entries(start, chunk)
+            try:
+                response = self.sqs.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+                successful = response.get('Successful', [])
+                failed, retry_entries = _split_failed(entries, response.get('Failed', []))
+                if retry_entries:
+                    self.logger.debug("Retrying %s failed messages", len(retry_entries))
+                    retry_response = self.sqs.send_message_batch(QueueUrl=self.queue_url, Entries=retry_entries)
+                    successful = successful + retry_response.get('Successful', [])
+                    failed = failed + retry_response.get('Failed', [])
+            except Exception as e:
+                self.logger.error("Failed to send messages after %s of %s were sent: %s",
+                                  len(result['Successful']), len(bodies), str(e))
+                raise
+
+            for entry in successful:
+                self.logger.debug("Message sent: ID = %s", entry["MessageId"])
+            for entry in failed:
+                self.logger.error("Failed to send message: %s", entry.get('Message', entry['Code']))
+
+            result['Successful'].extend(successful)
+            result['Failed'].extend(failed)
+
+        return result
+
+    def _raise_for_failed_entry(self, entry: dict, operation_name: str) -> None:
+        error_response = {'Error': {'Code': entry['Code'], 'Message': entry.get('Message', '')}}
+        raise self.sqs.exceptions.from_code(entry['Code'])(error_response, operation_name)
+
+    def send_json(self, obj) -> dict:
+        """
+        Serializes an object to compact JSON, using orjson when installed, and sends it to the SQS queue.
+
+        Args:
+            obj: The JSON serializable body of the message.
+        Returns:
+            dict: response from AWS SQS, with 'MessageId' and 'MD5OfMessageBody'
+        Raises:
+            ClientError: If SQS rejects the message.
+        """
+        return self.send_message(_dumps(obj))
+
+    def send_json_messages(self, objs: list) -> dict:
+        """
+        Serializes objects to compact JSON, using orjson when installed, and sends them to the SQS queue in batches.
+
+        Args:
+            objs (list): The JSON serializable bodies of the messages.
+        Returns:
+            dict: aggregated 'Successful' and 'Failed' entries from AWS SQS
+        """
+        return self.send_messages([_dumps(obj) for obj in objs])
+
+    def read_events_with_retry(self, max_retry_attempts: int = None, max_batch: int = 10,
+                               visibility_timeout: int = 60, wait_time_seconds: int = MAX_WAIT_TIME_SECONDS,
+                               message_attribute_names: list = None, attribute_names: list = None) -> list:
+        """
+        Reads events from the SQS queue. Throttling and transient errors are retried by botocore
+        with exponential backoff, up to the max_retry_attempts the client was created with.
+        Attributes are fetched only when requested; payload-only consumers should omit them to cut response size.
+        Long polling for 20 seconds halves the empty-receive rate compared to 10 seconds,
+        while messages are still returned as soon as they arrive.
+
+        Args:
+            wait_time_seconds (int: The amount of seconds client will be polling messages from the queue, 0 to 20
+            visibility_timeout (int): The amount of seconds,a messages stays inside the queue before getting removed
+            max_retry_attempts (int): Deprecated, ignored with a DeprecationWarning; set it on the client.
+            max_batch (int): The maximum number of messages to retrieve in each batch, 1 to 10.
+            message_attribute_names (list): The message attributes to retrieve, e.g. ['All'], or None to skip them.
+            attribute_names (list): The system attributes to retrieve, e.g. ['All'], or None to skip them.
+
+        Returns:
+            list: A list of messages retrieved from the queue.
+
+        Raises:
+            ValueError: If max_batch or wait_time_seconds is out of the range accepted by SQS.
+            ClientError: If an error occurs while reading from the queue.
+        """
+        if max_retry_attempts is not None:
+            warnings.warn("max_retry_attempts is ignored, pass it to the SQSClient constructor instead",
+                          DeprecationWarning, stacklevel=2)
+        _validate_max_batch(max_batch)
+        _validate_wait_time_seconds(wait_time_seconds)
+
         try:
-            response = self.sqs.send_message(
-                QueueUrl=self.queue_url,
-                MessageBody=body
-            )
-            self.logger.debug("Message sent: ID = %s", response["MessageId"])
-            return response
-        except Exception as e:
-            self.logger.error("Failed to send message: %s", str(e))
+            return self._receive_messages(max_batch, visibility_timeout, wait_time_seconds,
+                                          message_attribute_names, attribute_names)
+        except ClientError as e:
+            self.logger.error("Failed to read messages: %s", str(e))
             raise
 
-    def read_events_with_retry(self, max_retry_attempts: int = 3, max_batch: int = 10,
-                               visibility_timeout: int = 60, wait_time_seconds: int = 10) -> list:
+    def read_events_parallel(self, total: int, concurrency: int = 4, visibility_timeout: int = 60,
+                             wait_time_seconds: int = MAX_WAIT_TIME_SECONDS, message_attribute_names: list = None,
+                             attribute_names: list = None) -> list:
         """
-        Reads events from the SQS queue with retry.
+        Reads events from the SQS queue using concurrent receive requests of up to 10 messages each.
 
         Args:
-            wait_time_seconds (int: The amount of seconds client will be polling messages from the queue
+            total (int): The maximum number of messages to retrieve.
+            concurrency (int): The number of receive requests in flight at once, capped at the connection pool size.
             visibility_timeout (int): The amount of seconds,a messages stays inside the queue before getting removed
-            max_retry_attempts (int): The maximum number of retry attempts.
-            max_batch (int): The maximum number of messages to retrieve in each batch.
+            wait_time_seconds (int): The amount of seconds client will be polling messages from the queue
+            message_attribute_names (list): The message attributes to retrieve, e.g. ['All'], or None to skip them.
+            attribute_names (list): The system attributes to retrieve, e.g. ['All'], or None to skip them.
 
         Returns:
             list: A list of messages retrieved from the queue.
 
         Raises:
-            HTTPClientError: If an error occurs while reading from the queue.
+            ValueError: If wait_time_seconds is out of the range accepted by SQS.
         """
-        retry_attempt = 1
+        _validate_wait_time_seconds(wait_time_seconds)
 
-        while retry_attempt <= max_retry_attempts:
-            try:
-                response = self.sqs.receive_message(
-                    QueueUrl=self.queue_url,
-                    MaxNumberOfMessages=max_batch,
-                    MessageAttributeNames=['All'],
-                    AttributeNames=['All'],
-                    VisibilityTimeout=visibility_timeout,
-                    WaitTimeSeconds=wait_time_seconds,
-                )
+        batches = [min(BATCH_SIZE, total - start) for start in range(0, total, BATCH_SIZE)]
 
-                messages = response.get('Messages', [])
+        def receive(max_batch: int) -> list:
+            return self._receive_messages(max_batch, visibility_timeout, wait_time_seconds,
+                                          message_attribute_names, attribute_names)
 
-                return messages
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, self.max_pool_connections))) as executor:
+            return [message for messages in executor.map(receive, batches) for message in messages]
 
-            except WaiterError as e:
-                self.logger.debug("WaiterError: %s", str(e))
-                self.logger.debug("Retry attempt: %s", retry_attempt)
-                self._init_client()
-                if retry_attempt == max_retry_attempts:
-                    self.logger.error("Max retry attempts reached. Exiting.")
-                    raise HTTPClientError
+    def _receive_messages(self, max_batch: int, visibility_timeout: int, wait_time_seconds: int,
+                          message_attribute_names: list, attribute_names: list) -> list:
+        response = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=max_batch,
+            VisibilityTimeout=visibility_timeout,
+            WaitTimeSeconds=wait_time_seconds,
+            **_attribute_kwargs(message_attribute_names, attribute_names)
+        )
+        return response.get('Messages', [])
+
+    def start_prefetcher(self, buffer_size: int = 100, concurrency: int = 2, visibility_timeout: int = 60,
+                         wait_time_seconds: int = MAX_WAIT_TIME_SECONDS, message_attribute_names: list = None,
+                         attribute_names: list = None) -> None:
+        """
+        Starts background threads long polling the SQS queue into a local buffer drained with next_event.
+        The threads refill the buffer whenever it drops below half of buffer_size, at least 1.
 
-                retry_attempt += 1
+        Args:
+            buffer_size (int): The number of messages the buffer aims to hold.
+            concurrency (int): The number of receiving threads.
+            visibility_timeout (int): The amount of seconds,a messages stays inside the queue before getting removed
+            wait_time_seconds (int): The amount of seconds client will be polling messages from the queue
+            message_attribute_names (list): The message attributes to retrieve, e.g. ['All'], or None to skip them.
+            attribute_names (list): The system attributes to retrieve, e.g. ['All'], or None to skip them.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If wait_time_seconds is out of the range accepted by SQS.
+        """
+        _validate_wait_time_seconds(wait_time_seconds)
+
+        if self._prefetch_threads:
+            return
+
+        self._prefetch_queue = buffer = queue.Queue()
+        self._prefetch_stop = stop = threading.Event()
+        self._prefetch_refill.set()
+        refill_threshold = max(1, buffer_size // 2)
+
+        def prefetch() -> None:
+            while not stop.is_set():
+                if buffer.qsize() >= refill_threshold:
+                    self._prefetch_refill.clear()
+                    if buffer.qsize() >= refill_threshold:
+                        self._prefetch_refill.wait(timeout=1)
+                    continue
+                try:
+                    messages = self._receive_messages(BATCH_SIZE, visibility_timeout, wait_time_seconds,
+                                                      message_attribute_names, attribute_names)
+                except Exception as e:
+                    self.logger.error("Failed to prefetch messages: %s", str(e))
+                    stop.wait(timeout=1)
+                    continue
+                if stop.is_set():
+                    break
+                for message in messages:
+                    buffer.put(message)
+
+        self._prefetch_threads = [threading.Thread(target=prefetch, daemon=True) for _ in range(concurrency)]
+        for thread in self._prefetch_threads:
+            thread.start()
+
+    def next_event(self, timeout: float = None) -> dict:
+        """
+        Takes the next event from the buffer filled by start_prefetcher.
+
+        Args:
+            timeout (float): The amount of seconds to wait for an event, or None to wait indefinitely.
+
+        Returns:
+            dict or None: The event dictionary, or None if no event arrived within the timeout
+                or the prefetcher was stopped and its buffer is drained.
+
+        Raises:
+            RuntimeError: If the prefetcher was never started.
+        """
+        if self._prefetch_queue is None:
+            raise RuntimeError("Prefetcher is not started")
+
+        try:
+            event = self._prefetch_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        finally:
+            self._prefetch_refill.set()
+
+        if event is _PREFETCH_STOPPED:
+            self._prefetch_queue.put(_PREFETCH_STOPPED)
+            return None
+        return event
+
+    def stop_prefetcher(self) -> None:
+        """
+        Stops the threads started by start_prefetcher without waiting for receive requests in flight;
+        messages they return are dropped. Messages left in the buffer or dropped
+        become visible in the queue again once their visibility timeout expires.
+        Consumers waiting in next_event get None once the buffer is drained.
+
+        Returns:
+            None
+        """
+        self._prefetch_stop.set()
+        self._prefetch_refill.set()
+        if self._prefetch_threads:
+            self._prefetch_queue.put(_PREFETCH_STOPPED)
+        self._prefetch_threads = []
 
     def delete_event_from_queue(self, event: dict) -> None:
         """
@@ -168,11 +476,40 @@ class SQSClient:
 
         Returns:
             None
+
+        Raises:
+            ClientError: If SQS rejects the deletion, e.g. for an invalid receipt handle.
         """
-        self.sqs.delete_message(
-            QueueUrl=self.queue_url,
-            ReceiptHandle=event['ReceiptHandle']
-        )
+        response = self.delete_events_from_queue([event])
+        for entry in response['Failed']:
+            self._raise_for_failed_entry(entry, 'DeleteMessage')
+
+    def delete_events_from_queue(self, events: list) -> dict:
+        """
+        Deletes events from the SQS queue in batches of up to 10 events per request.
+
+        Args:
+            events (list): The event dictionaries.
+
+        Returns:
+            dict: aggregated 'Successful' and 'Failed' entries from AWS SQS, with each entry 'Id'
+                being the index of its event in events
+        """
+        result = {'Successful': [], 'Failed': []}
+
+        for start in range(0, len(events), BATCH_SIZE):
+            chunk = events[start:start + BATCH_SIZE]
+            response = self.sqs.delete_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=_delete_entries(start, chunk)
+            )
+            for entry in response.get('Failed', []):
+                self.logger.error("Failed to delete message: %s", entry.get('Message', entry['Code']))
+
+            result['Successful'].extend(response.get('Successful', []))
+            result['Failed'].extend(response.get('Failed', []))
+
+        return result
 
     def purge(self) -> None:
         """
@@ -0,0 +1,131 @@
+import threading
+from collections import deque
+
+from botocore.exceptions import ClientError
+
+from .client import SQSClient, BATCH_SIZE
+
+RETRYABLE_ERROR_CODES = {'RequestThrottled', 'ThrottlingException', 'ServiceUnavailable', 'InternalError',
+                         'InternalFailure'}
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, ClientError):
+        status_code = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return status_code >= 500 or error.response.get('Error', {}).get('Code') in RETRYABLE_ERROR_CODES
+    return True
+
+
+class BufferedDeleter:
+    """
+    Buffers events for deletion and deletes them in batches,
+    either when 10 events are buffered or when the flush interval elapses, whichever comes first.
+    """
+
+    def __init__(self, client: SQSClient, flush_interval_ms: int = 100, max_retries: int = 5):
+        """
+        Initializes the deleter for the given client.
+
+        Args:
+            client (SQSClient): The client used to delete events.
+            flush_interval_ms (int): The maximum amount of milliseconds an event stays in the buffer.
+            max_retries (int): The number of consecutive failed flushes retried, with the interval doubled
+                after each, before the buffered events are dropped.
+        """
+        self.client = client
+        self.flush_interval_ms = flush_interval_ms
+        self.max_retries = max_retries
+
+        self._buffer = deque()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._failed_flushes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def delete(self, event: dict) -> None:
+        """
+        Adds an event to the buffer, flushing it when it holds a full batch.
+
+        Args:
+            event (dict): The event dictionary.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._buffer.append(event)
+            full = len(self._buffer) >= BATCH_SIZE
+            if not full:
+                self._schedule_flush()
+
+        if full:
+            self.flush()
+
+    def flush(self) -> dict:
+        """
+        Deletes all buffered events from the SQS queue, one batch of 10 events per request.
+        When a request fails with a retryable error, its batch and the batches after it are put back
+        into the buffer and retried with backoff. Events of a batch failing with a non-retryable error,
+        or still failing after max_retries, are dropped and become visible in the queue again
+        once their visibility timeout expires.
+
+        Returns:
+            dict: aggregated 'Successful' and 'Failed' entries from AWS SQS, with each entry 'Id'
+                being the index of its event in the flushed events
+
+        Raises:
+            Exception: If a request fails.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            events = list(self._buffer)
+            self._buffer.clear()
+
+        result = {'Successful': [], 'Failed': []}
+
+        for start in range(0, len(events), BATCH_SIZE):
+            try:
+                response = self.client.delete_events_from_queue(events[start:start + BATCH_SIZE])
+            except Exception as e:
+                self._failed_flushes += 1
+                if _is_retryable(e) and self._failed_flushes <= self.max_retries:
+                    self._requeue(events[start:])
+                else:
+                    self.client.logger.error("Dropping %s events after failed deletion: %s",
+                                             len(events[start:start + BATCH_SIZE]), str(e))
+                    self._failed_flushes = 0
+                    self._requeue(events[start + BATCH_SIZE:])
+                raise
+
+            self._failed_flushes = 0
+            for key in ('Successful', 'Failed'):
+                result[key].extend({**entry, 'Id': str(start + int(entry['Id']))} for entry in response[key])
+
+        return result
+
+    def _requeue(self, events: list) -> None:
+        if not events:
+            return
+        with self._lock:
+            self._buffer.extendleft(reversed(events))
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            delay = self.flush_interval_ms / 1000 * 2 ** self._failed_flushes
+            self._timer = threading.Timer(delay, self._flush_on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            self.client.logger.error("Failed to delete buffered events: %s", str(e))
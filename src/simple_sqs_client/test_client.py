@@ -39,7 +39,8 @@ class TestSQSClientIntegration(unittest.TestCase):
         try:
             # act
             self.client.send_message(body, event_type, component)
-            messages = self.client.read_events_with_retry(max_retry_attempts=3, max_batch=10)
+            messages = self.client.read_events_with_retry(max_batch=10,
+                                                         message_attribute_names=['All'])
 
             # assert
             self.assertEqual(len(messages), 1)
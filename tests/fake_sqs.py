@@ -0,0 +1,64 @@
+import boto3
+
+from simple_sqs_client import SQSClient
+from simple_sqs_client import client as client_module
+
+
+class FakeSQS:
+    """
+    Stand-in for the boto3 SQS client, recording calls and answering with queued or default responses.
+    """
+
+    exceptions = boto3.client('sqs', region_name='us-east-1', aws_access_key_id='test',
+                              aws_secret_access_key='test').exceptions
+
+    def __init__(self):
+        self.calls = []
+        self.responses = {}
+        self.closed = False
+
+    def respond(self, operation: str, response) -> None:
+        self.responses.setdefault(operation, []).append(response)
+
+    def _call(self, operation: str, **kwargs):
+        self.calls.append((operation, kwargs))
+        queued = self.responses.get(operation)
+        if queued:
+            response = queued.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response(**kwargs) if callable(response) else response
+        return getattr(self, '_default_' + operation)(**kwargs)
+
+    def send_message_batch(self, **kwargs):
+        return self._call('send_message_batch', **kwargs)
+
+    def delete_message_batch(self, **kwargs):
+        return self._call('delete_message_batch', **kwargs)
+
+    def receive_message(self, **kwargs):
+        return self._call('receive_message', **kwargs)
+
+    def close(self):
+        self.closed = True
+
+    @staticmethod
+    def _default_send_message_batch(QueueUrl, Entries):
+        return {'Successful': [{'Id': entry['Id'], 'MessageId': 'm' + entry['Id']} for entry in Entries]}
+
+    @staticmethod
+    def _default_delete_message_batch(QueueUrl, Entries):
+        return {'Successful': [{'Id': entry['Id']} for entry in Entries]}
+
+    @staticmethod
+    def _default_receive_message(QueueUrl, MaxNumberOfMessages, **kwargs):
+        return {'Messages': [{'ReceiptHandle': str(i), 'Body': 'body'} for i in range(MaxNumberOfMessages)]}
+
+
+def failed_entry(entry_id: str, sender_fault: bool, code: str = 'InternalError') -> dict:
+    return {'Id': entry_id, 'SenderFault': sender_fault, 'Code': code, 'Message': code}
+
+
+def reset_caches() -> None:
+    SQSClient._instances.clear()
+    client_module._CLIENT_CACHE.clear()
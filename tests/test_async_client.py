@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+
+from simple_sqs_client.client import MAX_BATCH_BYTES
+
+try:
+    from simple_sqs_client.async_client import AsyncSQSClient
+except ImportError:
+    AsyncSQSClient = None
+
+# IsolatedAsyncioTestCase is only available from Python 3.8
+AsyncTestCase = getattr(unittest, 'IsolatedAsyncioTestCase', unittest.TestCase)
+
+QUEUE_URL = 'https://sqs.us-east-1.amazonaws.com/123456789012/test'
+
+
+class FakeAsyncSQS:
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self, operation: str, kwargs: dict) -> None:
+        self.calls.append((operation, kwargs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def send_message_batch(self, **kwargs):
+        await self._call('send_message_batch', kwargs)
+        return {
+            'Successful': [{'Id': entry['Id'], 'MessageId': 'm'} for entry in kwargs['Entries'][:-1]],
+            'Failed': [{'Id': kwargs['Entries'][-1]['Id'], 'SenderFault': True, 'Code': 'InvalidMessageContents'}],
+        }
+
+    async def receive_message(self, **kwargs):
+        await self._call('receive_message', kwargs)
+        return {'Messages': [{'ReceiptHandle': str(i)} for i in range(kwargs['MaxNumberOfMessages'])]}
+
+    async def delete_message_batch(self, **kwargs):
+        await self._call('delete_message_batch', kwargs)
+        return {'Successful': [{'Id': entry['Id']} for entry in kwargs['Entries']]}
+
+
+@unittest.skipIf(AsyncSQSClient is None, 'aiobotocore is not installed')
+@unittest.skipIf(AsyncTestCase is unittest.TestCase, 'IsolatedAsyncioTestCase requires Python 3.8')
+class TestAsyncSQSClient(AsyncTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.client = AsyncSQSClient('us-east-1', 'key', 'secret', QUEUE_URL, max_pool_connections=3)
+        await self.client.initialize()
+        self.sqs = self.client.sqs = FakeAsyncSQS()
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+
+    async def test_requires_initialize(self):
+        client = AsyncSQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+
+        with self.assertRaises(RuntimeError):
+            await client.receive(10)
+
+    async def test_send_messages_uses_global_ids(self):
+        with self.assertLogs('simple_sqs_client.async_client', level='ERROR'):
+            result = await self.client.send_messages(['body'] * 25)
+
+        self.assertEqual([entry['Id'] for entry in result['Failed']], ['9', '19', '24'])
+        self.assertEqual(len(result['Successful']), 22)
+        self.assertEqual(len(self.sqs.calls), 3)
+
+    async def test_send_messages_chunks_by_payload_size(self):
+        with self.assertLogs('simple_sqs_client.async_client', level='ERROR'):
+            await self.client.send_messages(['x' * (MAX_BATCH_BYTES // 4)] * 10)
+
+        self.assertEqual(sorted(len(call[1]['Entries']) for call in self.sqs.calls), [2, 4, 4])
+
+    async def test_requests_are_bounded_by_pool_size(self):
+        messages = await self.client.receive(100, wait_time_seconds=0)
+
+        self.assertEqual(len(messages), 100)
+        self.assertEqual(len(self.sqs.calls), 10)
+        self.assertEqual(self.sqs.max_in_flight, 3)
+
+    async def test_delete_events_from_queue_uses_global_ids(self):
+        result = await self.client.delete_events_from_queue([{'ReceiptHandle': str(i)} for i in range(12)])
+
+        self.assertEqual([entry['Id'] for entry in result['Successful']], [str(i) for i in range(12)])
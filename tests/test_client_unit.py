@@ -0,0 +1,283 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from simple_sqs_client import SQSClient, SQSClientBuilder
+from simple_sqs_client import client as client_module
+from simple_sqs_client.client import MAX_BATCH_BYTES
+from .fake_sqs import FakeSQS, failed_entry, reset_caches
+
+QUEUE_URL = 'https://sqs.us-east-1.amazonaws.com/123456789012/test'
+
+
+class TestSQSClientSend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_caches()
+        self.client = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        self.sqs = self.client.sqs = FakeSQS()
+
+    def tearDown(self) -> None:
+        reset_caches()
+
+    def test_send_messages_chunks_with_global_ids(self):
+        result = self.client.send_messages(['body'] * 25)
+
+        entries = [call[1]['Entries'] for call in self.sqs.calls]
+        self.assertEqual([len(chunk) for chunk in entries], [10, 10, 5])
+        self.assertEqual([entry['Id'] for chunk in entries for entry in chunk], [str(i) for i in range(25)])
+        self.assertEqual(len(result['Successful']), 25)
+        self.assertEqual(result['Failed'], [])
+
+    def test_send_messages_chunks_by_payload_size(self):
+        body = 'x' * (MAX_BATCH_BYTES // 4)
+
+        self.client.send_messages([body] * 10)
+
+        self.assertEqual([len(call[1]['Entries']) for call in self.sqs.calls], [4, 4, 2])
+        self.assertEqual([entry['Id'] for call in self.sqs.calls for entry in call[1]['Entries']],
+                         [str(i) for i in range(10)])
+
+    def test_send_messages_retries_only_non_sender_faults(self):
+        self.sqs.respond('send_message_batch', {
+            'Successful': [{'Id': str(i), 'MessageId': 'm'} for i in range(8)],
+            'Failed': [failed_entry('8', sender_fault=False), failed_entry('9', sender_fault=True)],
+        })
+
+        result = self.client.send_messages(['body'] * 10)
+
+        retried = self.sqs.calls[1][1]['Entries']
+        self.assertEqual([entry['Id'] for entry in retried], ['8'])
+        self.assertEqual(len(result['Successful']), 9)
+        self.assertEqual([entry['Id'] for entry in result['Failed']], ['9'])
+
+    def test_send_messages_reports_failed_ids_per_body(self):
+        def fail_fourth(QueueUrl, Entries):
+            return {'Successful': [], 'Failed': [failed_entry(Entries[3]['Id'], sender_fault=True)]}
+
+        for _ in range(3):
+            self.sqs.respond('send_message_batch', fail_fourth)
+
+        result = self.client.send_messages(['body'] * 25)
+
+        self.assertEqual([entry['Id'] for entry in result['Failed']], ['3', '13', '23'])
+
+    def test_send_message_returns_message_id(self):
+        response = self.client.send_message('body')
+
+        self.assertEqual(response['MessageId'], 'm0')
+
+    def test_send_message_raises_on_rejected_message(self):
+        self.sqs.respond('send_message_batch', {
+            'Successful': [],
+            'Failed': [failed_entry('0', sender_fault=True, code='InvalidMessageContents')],
+        })
+
+        with self.assertRaises(ClientError) as context:
+            self.client.send_message('body')
+        self.assertEqual(context.exception.response['Error']['Code'], 'InvalidMessageContents')
+
+    def test_send_json_serializes_compactly(self):
+        self.client.send_json({'a': [1, 2], 1: 'b'})
+
+        self.assertEqual(self.sqs.calls[0][1]['Entries'][0]['MessageBody'], '{"a":[1,2],"1":"b"}')
+
+    def test_send_json_serializes_without_orjson(self):
+        with mock.patch.object(client_module, 'orjson', None):
+            self.client.send_json_messages([{1: 'b'}])
+
+        self.assertEqual(self.sqs.calls[0][1]['Entries'][0]['MessageBody'], '{"1":"b"}')
+
+
+class TestSQSClientDelete(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_caches()
+        self.client = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        self.sqs = self.client.sqs = FakeSQS()
+
+    def tearDown(self) -> None:
+        reset_caches()
+
+    def test_delete_events_from_queue_uses_global_ids(self):
+        events = [{'ReceiptHandle': 'r%s' % i} for i in range(12)]
+
+        result = self.client.delete_events_from_queue(events)
+
+        entries = [entry for call in self.sqs.calls for entry in call[1]['Entries']]
+        self.assertEqual([entry['Id'] for entry in entries], [str(i) for i in range(12)])
+        self.assertEqual([entry['ReceiptHandle'] for entry in entries], ['r%s' % i for i in range(12)])
+        self.assertEqual(len(result['Successful']), 12)
+
+    def test_delete_event_from_queue_raises_on_invalid_receipt_handle(self):
+        self.sqs.respond('delete_message_batch', {
+            'Successful': [],
+            'Failed': [failed_entry('0', sender_fault=True, code='ReceiptHandleIsInvalid')],
+        })
+
+        with self.assertRaises(self.sqs.exceptions.ReceiptHandleIsInvalid):
+            self.client.delete_event_from_queue({'ReceiptHandle': 'invalid'})
+
+
+class TestSQSClientReceive(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_caches()
+        self.client = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        self.sqs = self.client.sqs = FakeSQS()
+
+    def tearDown(self) -> None:
+        self.client.stop_prefetcher()
+        reset_caches()
+
+    def test_read_events_omits_attributes_by_default(self):
+        self.client.read_events_with_retry()
+
+        kwargs = self.sqs.calls[0][1]
+        self.assertNotIn('MessageAttributeNames', kwargs)
+        self.assertNotIn('AttributeNames', kwargs)
+
+    def test_read_events_requests_attributes_when_asked(self):
+        self.client.read_events_with_retry(message_attribute_names=['All'], attribute_names=['SentTimestamp'])
+
+        self.assertEqual(self.sqs.calls[0][1]['MessageAttributeNames'], ['All'])
+        self.assertEqual(self.sqs.calls[0][1]['AttributeNames'], ['SentTimestamp'])
+
+    def test_read_events_defaults_to_long_polling(self):
+        self.client.read_events_with_retry()
+
+        self.assertEqual(self.sqs.calls[0][1]['WaitTimeSeconds'], 20)
+
+    def test_read_events_validates_arguments(self):
+        for kwargs in [{'max_batch': 0}, {'max_batch': 11}, {'wait_time_seconds': -1}, {'wait_time_seconds': 21}]:
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                self.client.read_events_with_retry(**kwargs)
+        self.assertEqual(self.sqs.calls, [])
+
+    def test_read_events_parallel_validates_wait_time_seconds(self):
+        with self.assertRaises(ValueError):
+            self.client.read_events_parallel(10, wait_time_seconds=21)
+
+    def test_read_events_warns_on_ignored_max_retry_attempts(self):
+        with self.assertWarns(DeprecationWarning):
+            self.client.read_events_with_retry(max_retry_attempts=3)
+
+    def test_read_events_parallel_fans_out_batches(self):
+        messages = self.client.read_events_parallel(25, concurrency=3)
+
+        self.assertEqual(sorted(call[1]['MaxNumberOfMessages'] for call in self.sqs.calls), [5, 10, 10])
+        self.assertEqual(len(messages), 25)
+
+    def test_prefetcher_fills_small_buffer(self):
+        self.client.start_prefetcher(buffer_size=1, concurrency=1)
+
+        self.assertIsNotNone(self.client.next_event(timeout=2))
+
+    def test_prefetcher_drops_messages_received_after_stop(self):
+        received = threading.Event()
+
+        def slow_receive(**kwargs):
+            received.set()
+            time.sleep(0.2)
+            return {'Messages': [{'ReceiptHandle': 'late'}]}
+
+        self.sqs.respond('receive_message', slow_receive)
+        self.client.start_prefetcher(buffer_size=10, concurrency=1)
+        received.wait(timeout=1)
+        self.client.stop_prefetcher()
+        time.sleep(0.4)
+
+        self.assertIsNone(self.client.next_event(timeout=0))
+
+    def test_stop_prefetcher_wakes_waiting_consumer(self):
+        self.sqs.respond('receive_message', lambda **kwargs: time.sleep(0.5) or {})
+        self.client.start_prefetcher(buffer_size=10, concurrency=1)
+        events = []
+        consumer = threading.Thread(target=lambda: events.append(self.client.next_event()))
+        consumer.start()
+
+        self.client.stop_prefetcher()
+        consumer.join(timeout=1)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(events, [None])
+
+    def test_next_event_requires_started_prefetcher(self):
+        with self.assertRaises(RuntimeError):
+            self.client.next_event(timeout=0)
+
+
+class TestSQSClientConfig(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_caches()
+
+    def tearDown(self) -> None:
+        reset_caches()
+
+    def test_client_uses_tuned_connection_settings(self):
+        client = SQSClientBuilder() \
+            .with_region('us-east-1') \
+            .with_aws_credentials('key', 'secret') \
+            .with_queue_url(QUEUE_URL) \
+            .with_max_pool_connections(20) \
+            .build()
+
+        config = client.sqs.meta.config
+        self.assertEqual(config.max_pool_connections, 20)
+        self.assertTrue(config.tcp_keepalive)
+        self.assertEqual(config.retries['mode'], 'standard')
+
+
+class TestSQSClientCaching(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_caches()
+
+    def tearDown(self) -> None:
+        reset_caches()
+
+    def test_cached_instance_is_not_reinitialized(self):
+        first = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        sqs = first.sqs
+
+        second = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+
+        self.assertIs(first, second)
+        self.assertIs(second.sqs, sqs)
+
+    def test_different_settings_create_separately_tuned_instance(self):
+        default = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+
+        tuned = SQSClientBuilder() \
+            .with_region('us-east-1') \
+            .with_aws_credentials('key', 'secret') \
+            .with_queue_url(QUEUE_URL) \
+            .with_max_pool_connections(200) \
+            .with_max_retry_attempts(1) \
+            .build()
+
+        self.assertIsNot(default, tuned)
+        self.assertEqual(tuned.sqs.meta.config.max_pool_connections, 200)
+        self.assertEqual(default.sqs.meta.config.max_pool_connections, 50)
+
+    def test_queues_share_client(self):
+        first = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        second = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL + '-other')
+        other_region = SQSClient('eu-west-1', 'key', 'secret', QUEUE_URL)
+
+        self.assertIs(first.sqs, second.sqs)
+        self.assertIsNot(first.sqs, other_region.sqs)
+
+    def test_instances_are_keyed_by_connection_parameters(self):
+        positional = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        keyword = SQSClient(region_name='us-east-1', aws_access_key_id='key', aws_secret_access_key='secret',
+                            queue_url=QUEUE_URL)
+        other_queue = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL + '-other')
+
+        self.assertIs(positional, keyword)
+        self.assertIsNot(positional, other_queue)
+        self.assertEqual(len(SQSClient._instances), 2)
@@ -0,0 +1,102 @@
+import time
+import unittest
+
+from botocore.exceptions import ClientError
+
+from simple_sqs_client import SQSClient, BufferedDeleter
+from .fake_sqs import FakeSQS, reset_caches
+
+QUEUE_URL = 'https://sqs.us-east-1.amazonaws.com/123456789012/test'
+
+
+def client_error(code: str, status_code: int) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': code}, 'ResponseMetadata': {'HTTPStatusCode': status_code}},
+                       'DeleteMessageBatch')
+
+
+class TestBufferedDeleter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_caches()
+        self.client = SQSClient('us-east-1', 'key', 'secret', QUEUE_URL)
+        self.sqs = self.client.sqs = FakeSQS()
+
+    def tearDown(self) -> None:
+        reset_caches()
+
+    def handles(self) -> list:
+        return [[entry['ReceiptHandle'] for entry in call[1]['Entries']] for call in self.sqs.calls]
+
+    def test_flushes_full_batch(self):
+        deleter = BufferedDeleter(self.client, flush_interval_ms=10000)
+
+        for i in range(10):
+            deleter.delete({'ReceiptHandle': str(i)})
+
+        self.assertEqual(len(self.sqs.calls), 1)
+        self.assertEqual(len(self.sqs.calls[0][1]['Entries']), 10)
+
+    def test_flushes_after_interval(self):
+        deleter = BufferedDeleter(self.client, flush_interval_ms=20)
+
+        deleter.delete({'ReceiptHandle': '0'})
+        time.sleep(0.2)
+
+        self.assertEqual(len(self.sqs.calls), 1)
+
+    def test_flush_returns_failed_entries(self):
+        self.sqs.respond('delete_message_batch', {
+            'Successful': [],
+            'Failed': [{'Id': '0', 'SenderFault': True, 'Code': 'ReceiptHandleIsInvalid'}],
+        })
+
+        with BufferedDeleter(self.client) as deleter:
+            deleter.delete({'ReceiptHandle': 'invalid'})
+            result = deleter.flush()
+
+        self.assertEqual([entry['Id'] for entry in result['Failed']], ['0'])
+
+    def test_failed_flush_requeues_only_unprocessed_batches(self):
+        deleter = BufferedDeleter(self.client, flush_interval_ms=10000)
+        deleter._buffer.extend({'ReceiptHandle': str(i)} for i in range(15))
+        self.sqs.respond('delete_message_batch', {'Successful': [{'Id': str(i)} for i in range(10)]})
+        self.sqs.respond('delete_message_batch', client_error('InternalError', 500))
+
+        with self.assertRaises(ClientError):
+            deleter.flush()
+        result = deleter.flush()
+
+        self.assertEqual(self.handles()[2], [str(i) for i in range(10, 15)])
+        self.assertEqual([entry['Id'] for entry in result['Successful']], [str(i) for i in range(5)])
+
+    def test_non_retryable_error_drops_batch(self):
+        self.sqs.respond('delete_message_batch', client_error('AccessDenied', 403))
+        deleter = BufferedDeleter(self.client, flush_interval_ms=10000)
+        deleter.delete({'ReceiptHandle': '0'})
+
+        with self.assertLogs('simple_sqs_client.client', level='ERROR'), self.assertRaises(ClientError):
+            deleter.flush()
+
+        self.assertEqual(len(deleter._buffer), 0)
+
+    def test_timer_retries_with_backoff_up_to_limit(self):
+        for _ in range(5):
+            self.sqs.respond('delete_message_batch', RuntimeError('connection lost'))
+        deleter = BufferedDeleter(self.client, flush_interval_ms=20, max_retries=2)
+
+        with self.assertLogs('simple_sqs_client.client', level='ERROR'):
+            deleter.delete({'ReceiptHandle': '0'})
+            time.sleep(0.5)
+
+        self.assertEqual(len(self.sqs.calls), 3)
+        self.assertEqual(len(deleter._buffer), 0)
+
+    def test_timer_retry_succeeds_after_transient_error(self):
+        self.sqs.respond('delete_message_batch', RuntimeError('connection lost'))
+        deleter = BufferedDeleter(self.client, flush_interval_ms=20)
+
+        with self.assertLogs('simple_sqs_client.client', level='ERROR'):
+            deleter.delete({'ReceiptHandle': '0'})
+            time.sleep(0.2)
+
+        self.assertEqual(self.handles(), [['0'], ['0']])